@@ -1,10 +1,15 @@
 import os, glob
 from time import perf_counter, time, sleep
+from collections import deque
+import threading
 import multiprocessing as mp
+import numpy as np
 import pyqtgraph as pg
 
+IS_WIN = os.name == "nt"
+
 # import depending on windows or linux
-if os.name == "nt":
+if IS_WIN:
     from windows.PM100_Windows import PM100D
 else:
     from linux.PM100_Linux import PM100D
@@ -27,7 +32,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtGui import QIcon, QFontDatabase, QColor
 import PyQt6.QtCore as QtCore
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal as Signal
+from PyQt6.QtCore import Qt, QTimer, QSocketNotifier, pyqtSignal as Signal
 
 
 class FrameCounter(QtCore.QObject):
@@ -55,6 +60,76 @@ class FrameCounter(QtCore.QObject):
         self.sigFpsUpdate.emit(fps)
 
 
+# platform-specific read resolved once at import, so the per-sample hot
+# path carries no os.name branch
+if IS_WIN:
+
+    def _read_pm(pm):
+        return pm.deviceNET.measPower()[1]
+
+else:
+
+    def _read_pm(pm):
+        return pm.read
+
+
+# pens built once at import; mkPen parses the colour spec and allocates a
+# QPen every call, so keep it out of anything that might rerun per frame
+MAIN_PEN = pg.mkPen("k", width=2)
+TIME_PEN = pg.mkPen("k", width=1)
+MAX_PEN = pg.mkPen(QColor(20, 20, 200, 50), width=2)
+
+# numba is optional; without it _m4 falls back to its NumPy loop
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _m4_kernel(t, p, edges, out_t, out_p):
+        for b in range(edges.shape[0] - 1):
+            lo = edges[b]
+            hi = edges[b + 1]
+            if hi <= lo:
+                hi = lo + 1
+            imin = lo
+            imax = lo
+            for k in range(lo + 1, hi):
+                if p[k] < p[imin]:
+                    imin = k
+                if p[k] > p[imax]:
+                    imax = k
+            # entry/min/max/exit, kept in time order
+            a, c = (imin, imax) if imin <= imax else (imax, imin)
+            base = 4 * b
+            out_t[base] = t[lo]
+            out_p[base] = p[lo]
+            out_t[base + 1] = t[a]
+            out_p[base + 1] = p[a]
+            out_t[base + 2] = t[c]
+            out_p[base + 2] = p[c]
+            out_t[base + 3] = t[hi - 1]
+            out_p[base + 3] = p[hi - 1]
+
+else:
+    _m4_kernel = None
+
+
+def _save_csv(fileName, t, p):
+    # module-level so it can be pickled to the spawned writer process
+    np.savetxt(
+        fileName,
+        np.column_stack([t, p]),
+        # epoch timestamps need fixed-point: %.9g keeps 9 significant
+        # digits, which rounds ~1.7e9 s to ~10 s granularity
+        fmt="%.7f, %.9g",
+        header="Time (s), Power (W)",
+        comments="",
+    )
+
+
 class PowerMeterPlot(QWidget):
 
     def __init__(self, powermeter: PM100D = None, device: str = None):
@@ -63,82 +138,269 @@ class PowerMeterPlot(QWidget):
         self.pm = powermeter
         self.device = device
 
-        self.timeData = []
-        self.powerData = []
+        # preallocated ring buffers so appending a sample never reallocates
+        self._cap = 1 << 20
+        self._t = np.empty(self._cap)
+        # readings carry ~6 significant digits, so float32 is plenty and
+        # halves the bandwidth of every scan; timestamps stay float64
+        self._p = np.empty(self._cap, dtype=np.float32)
+        self._head = 0
+        self._n = 0
+        self._max = -np.inf
+
+        # cached overview curve: completed entry/min/max/exit bins plus the
+        # accumulators for the bin currently being filled. Completed bins
+        # live in flat preallocated arrays as a [start:end) sliding window
+        # that compacts to the front when the tail runs out, so setData
+        # always gets an ordered zero-copy view; the slot at end is kept
+        # spare for the in-progress sample
+        self._OV_BIN = 32
+        _ov_pts = 4 * (self._cap // self._OV_BIN)
+        self._ov_ta = np.empty(2 * _ov_pts)
+        self._ov_pa = np.empty(2 * _ov_pts, dtype=np.float32)
+        self._ov_start = 0
+        self._ov_end = 0
+        self._ov_cnt = 0
+        self._ov_dirty = False
+
+        # acquisition runs on its own thread and hands samples to the GUI
+        # through a thread-safe deque, so the USB round-trip never blocks
+        # painting and the sample rate is decoupled from the refresh rate
+        self._queue = deque(maxlen=self._cap)
+        self._acq_stop = threading.Event()
+        self._acq_fail = False
+        self._acq_thread = None
+        self._interval = 0
+        self._dirty_region = True
+        self._last_bounds = None
+        self._last_region = None
+
+        # last strings pushed into the labels; setText only on change so a
+        # steady reading doesn't recompute styles every frame
+        self._last_power_text = ""
+        self._last_max_text = ""
+        self._last_numvals_text = ""
+        self._last_fps_text = ""
 
         self.initUI()
 
+    def _ov_push(self, t, p):
+        # fold one sample into the overview cache; O(1) amortized instead of
+        # re-downsampling the whole history every frame
+        if self._ov_cnt == 0:
+            self._ov_first = (t, p)
+            self._ov_min = (t, p)
+            self._ov_max = (t, p)
+        else:
+            if p < self._ov_min[1]:
+                self._ov_min = (t, p)
+            if p > self._ov_max[1]:
+                self._ov_max = (t, p)
+        self._ov_last = (t, p)
+        self._ov_cnt += 1
+        self._ov_dirty = True
+        if self._ov_cnt == self._OV_BIN:
+            # compact before the window (plus the spare slot) would overrun
+            if self._ov_end + 5 > self._ov_ta.shape[0]:
+                n = self._ov_end - self._ov_start
+                self._ov_ta[:n] = self._ov_ta[self._ov_start : self._ov_end]
+                self._ov_pa[:n] = self._ov_pa[self._ov_start : self._ov_end]
+                self._ov_start = 0
+                self._ov_end = n
+            e = self._ov_end
+            for tt, pp in sorted(
+                (self._ov_first, self._ov_min, self._ov_max, self._ov_last)
+            ):
+                self._ov_ta[e] = tt
+                self._ov_pa[e] = pp
+                e += 1
+            self._ov_end = e
+            self._ov_cnt = 0
+            # once the ring buffer wraps, retire the oldest bin as well
+            if self._ov_end - self._ov_start > 4 * (self._cap // self._OV_BIN):
+                self._ov_start += 4
+
+    def times(self):
+        # oldest-to-newest view; only wraps once the buffer is full
+        if self._n < self._cap:
+            return self._t[: self._n]
+        return np.concatenate((self._t[self._head :], self._t[: self._head]))
+
+    def powers(self):
+        if self._n < self._cap:
+            return self._p[: self._n]
+        return np.concatenate((self._p[self._head :], self._p[: self._head]))
+
+    def _m4(self, t, p, i, j, buckets):
+        # M4 downsampling: keep entry/min/max/exit per bucket so transient
+        # spikes survive where plain striding would skip over them
+        n = j - i
+        if buckets < 1 or n <= 4 * buckets:
+            return t[i:j], p[i:j]
+        edges = np.linspace(i, j, buckets + 1).astype(np.intp)
+        out_t = np.empty(4 * buckets)
+        out_p = np.empty(4 * buckets)
+        if _m4_kernel is not None:
+            _m4_kernel(t, p, edges, out_t, out_p)
+            return out_t, out_p
+        for b in range(buckets):
+            lo = edges[b]
+            hi = max(edges[b + 1], lo + 1)
+            seg = p[lo:hi]
+            idx = np.sort(np.array([0, seg.argmin(), seg.argmax(), hi - lo - 1])) + lo
+            out_t[4 * b : 4 * b + 4] = t[idx]
+            out_p[4 * b : 4 * b + 4] = p[idx]
+        return out_t, out_p
+
     def try_read_pm(self):
+        # OSError covers the USBTMC path and the .NET interop errors derive
+        # from Exception; a bare except would also swallow KeyboardInterrupt
+        # and SystemExit
         try:
-            if os.name == "nt":
-                _, pow = self.pm.deviceNET.measPower()
-            else:
-                pow = self.pm.read
-        except:
+            return _read_pm(self.pm)
+        except Exception:
+            return None
+
+    def _acquire(self, stop):
+        # producer loop: read as configured and queue (timestamp, power).
+        # the stop event is captured per thread so a stale producer can
+        # never be revived by a later start
+        while not stop.is_set():
+            pow = self.try_read_pm()
+            if pow is None:
+                self._acq_fail = True
+                return
+            self._queue.append((time(), pow))
+            if self._interval:
+                stop.wait(self._interval / 1000)
+
+    def start_acquisition(self):
+        self._acq_fail = False
+        self._acq_stop = threading.Event()
+        self._acq_thread = threading.Thread(
+            target=self._acquire, args=(self._acq_stop,), daemon=True
+        )
+        self._acq_thread.start()
+
+    def stop_acquisition(self):
+        self._acq_stop.set()
+        if self._acq_thread is not None:
+            # bounded by one in-flight read; guarantees only ever one
+            # producer talking to the meter
+            self._acq_thread.join()
+            self._acq_thread = None
+
+    def update(self):
+        now = time()
+
+        # if the acquisition thread hit a read error, show the disconnect
+        if self._acq_fail:
             self.timer.stop()
             self.startstop.setStyleSheet(
                 "background-color: red; color: white; font-weight: bold"
             )
             self.startstop.setText("Disconnected")
-            return None
-        return pow
-
-    def update(self):
-        now = time()
+            return
 
         # if the region spans the last time point, extend it to the new time point
         minX, maxX = self.region.getRegion()
-        if self.timeData:
-            if minX < self.timeData[0]:
-                minX = self.timeData[0]
+        if self._n:
+            # once the ring wraps, slot 0 is no longer the oldest sample
+            # and the newest sits just behind the head
+            oldest = self._t[self._head] if self._n == self._cap else self._t[0]
+            newest = self._t[(self._head - 1) % self._cap]
+            if minX < oldest:
+                minX = oldest
                 maxX = now
-            elif maxX >= self.timeData[-1]:
+            elif maxX >= newest:
                 maxX = now
 
-        # check if we can read from pm and if not stop the timer
-        pow = self.try_read_pm()
-        if pow:
-            self.timeData.append(now)
-            self.powerData.append(pow)
+        # drain everything the acquisition thread queued since last frame
+        drained = len(self._queue)
+        while self._queue:
+            t_s, pow = self._queue.popleft()
+            self._t[self._head] = t_s
+            self._p[self._head] = pow
+            self._head = (self._head + 1) % self._cap
+            self._n = min(self._n + 1, self._cap)
+            # samples only append, so the max is maintained in O(1)
+            if pow > self._max:
+                self._max = pow
+                self.maxline.setValue(pow)
+            self._ov_push(t_s, pow)
+
+        if not self._n:
+            return
+
+        # nothing new and the view hasn't moved: nothing to redraw
+        if not drained and not self._dirty_region:
+            return
+        self._dirty_region = False
+
+        t = self.times()
+        p = self.powers()
 
         # given minX and maxX, crop down to only the relevant data
-        i = 0
-        j = len(self.timeData)
-        while self.timeData[i] < minX:
-            i += 1
-        if j > 1:
-            while self.timeData[j - 1] > maxX:
-                j -= 1
-
-        # only plot at max 1000 points so downsample them with the relevant stride
+        # timestamps are monotonic so a binary search finds the window
+        i = int(np.searchsorted(t, minX, side="left"))
+        j = max(int(np.searchsorted(t, maxX, side="right")), i + 1)
+
+        # downsample to the plot's pixel budget, keeping per-pixel extremes
         numvals = j - i
-        stride = len(self.timeData) // 1000 + 1
-        stride2 = int(numvals // 1000 + 1)
-        self.maincurve.setData(self.timeData[i:j:stride2], self.powerData[i:j:stride2])
-        maximum = max(self.powerData[i:j])
-        self.maxline.setValue(maximum)
-        self.timecurve.setData(self.timeData[::stride], self.powerData[::stride])
-        # automatically swap between uW and mW
-        self.current_power.setText(
-            f"{self.powerData[-1]*1e3:.2f} mW"
-            if self.powerData[-1] > 1e-3
-            else f"{self.powerData[-1]*1e6:.2f} uW"
-        )
-        self.max_power.setText(
-            f"/{maximum*1e3:.2f} mW" if maximum > 1e-3 else f"/{maximum*1e6:.2f} uW"
+        x_ds, y_ds = self._m4(t, p, i, j, max(self.mainplot.width(), 1))
+        self.maincurve.setData(
+            x_ds.astype(np.float64, copy=False), y_ds.astype(np.float64, copy=False)
         )
+        maximum = self._max
+        if self._ov_dirty:
+            self._ov_dirty = False
+            end = self._ov_end
+            if self._ov_cnt:
+                # stash the in-progress sample in the spare slot so the
+                # feed stays a view rather than a copy
+                self._ov_ta[end] = self._ov_last[0]
+                self._ov_pa[end] = self._ov_last[1]
+                end += 1
+            self.timecurve.setData(
+                self._ov_ta[self._ov_start : end],
+                self._ov_pa[self._ov_start : end],
+            )
+        # automatically swap between uW and mW
+        txt = f"{p[-1]*1e3:.2f} mW" if p[-1] > 1e-3 else f"{p[-1]*1e6:.2f} uW"
+        if txt != self._last_power_text:
+            self._last_power_text = txt
+            self.current_power.setText(txt)
+        txt = f"/{maximum*1e3:.2f} mW" if maximum > 1e-3 else f"/{maximum*1e6:.2f} uW"
+        if txt != self._last_max_text:
+            self._last_max_text = txt
+            self.max_power.setText(txt)
         # format with commas
-        self.numvals.setText(f"# readings: {numvals:,} / {len(self.timeData):,}")
-
-        self.region.setBounds([self.timeData[0], self.timeData[-1]])
-        self.region.setRegion([minX, maxX])
+        txt = f"# readings: {numvals:,} / {self._n:,}"
+        if txt != self._last_numvals_text:
+            self._last_numvals_text = txt
+            self.numvals.setText(txt)
+
+        # only touch the region item when something actually moved -
+        # setRegion emits sigRegionChanged which schedules another repaint
+        bounds = (t[0], t[-1])
+        if bounds != self._last_bounds:
+            self._last_bounds = bounds
+            self.region.setBounds(bounds)
+        region = (minX, maxX)
+        if region != self._last_region:
+            self._last_region = region
+            self.region.blockSignals(True)
+            self.region.setRegion(region)
+            self.region.blockSignals(False)
+            self.mainplot.setXRange(minX, maxX, padding=0)
 
         self.framecnt.update()
 
     # callback to reset region
     def mouseDoubleClickEvent(self, event):
-        if self.timeData:
-            self.region.setRegion([self.timeData[0], self.timeData[-1]])
+        if self._n:
+            t = self.times()
+            self.region.setRegion([t[0], t[-1]])
 
     def create_mainplot(self):
         # zoomed plot of power
@@ -151,21 +413,17 @@ class PowerMeterPlot(QWidget):
         mainplot.setLabel("left", "Power", units="W")
         mainplot.hideButtons()
 
-        maincurve = mainplot.plot(
-            self.timeData,
-            self.powerData,
-            pen=pg.mkPen("k", width=2),
-            autoDownsample=True,
-            downsampleMethod="peak",
-            clipToView=True,
-            skipFiniteCheck=True,
-        )
+        # raw PlotCurveItem: we hand it pre-downsampled float64 arrays, so
+        # skip PlotDataItem's validation/downsampling layer and let the path
+        # build go straight through arrayToQPath with the finite check off
+        maincurve = pg.PlotCurveItem(pen=MAIN_PEN, skipFiniteCheck=True)
+        mainplot.addItem(maincurve)
 
         maxline = pg.InfiniteLine(
             pos=0,
             angle=0,
             movable=False,
-            pen=pg.mkPen(QColor(20, 20, 200, 50), width=2),
+            pen=MAX_PEN,
         )
         mainplot.addItem(maxline)
 
@@ -185,9 +443,9 @@ class PowerMeterPlot(QWidget):
         timeplot.enableAutoRange(x=True, y=True)
 
         self.timecurve = timeplot.plot(
-            self.timeData,
-            self.powerData,
-            pen=pg.mkPen("k", width=1),
+            self.times(),
+            self.powers(),
+            pen=TIME_PEN,
             autoDownsample=True,
             downsampleMethod="peak",
             clipToView=True,
@@ -196,6 +454,7 @@ class PowerMeterPlot(QWidget):
 
         def updateMainwhenRegionChanges():
             # print("updated main: ", self.region.getRegion())
+            self._dirty_region = True
             minX, maxX = self.region.getRegion()
             mainplot.setXRange(minX, maxX, padding=0)
 
@@ -205,7 +464,7 @@ class PowerMeterPlot(QWidget):
 
     def set_wavelength(self, wavelength):
         if self.pm is not None:
-            if os.name == "nt":
+            if IS_WIN:
                 self.pm.setWaveLength(wavelength)
                 self.wavelength.setMinimum(int(self.pm.wavelengthMin))
                 self.wavelength.setMaximum(int(self.pm.wavelengthMax))
@@ -222,7 +481,7 @@ class PowerMeterPlot(QWidget):
 
     def set_average(self, average):
         if self.pm is not None:
-            if os.name == "nt":
+            if IS_WIN:
                 print("Average not implemented on windows")
             else:
                 self.pm.sense.average.count = average
@@ -235,6 +494,15 @@ class PowerMeterPlot(QWidget):
         pg.setConfigOption("background", "#eeeeee")
         pg.setConfigOption("foreground", "#000000")
         # pg.setConfigOptions(antialias=True)
+        # draw curves on the GPU if PyOpenGL is installed - one VBO draw
+        # call instead of thousands of QPainter line segments
+        try:
+            import OpenGL  # noqa: F401
+
+            pg.setConfigOption("useOpenGL", True)
+            pg.setConfigOption("enableExperimental", True)
+        except ImportError:
+            pass
 
         self.layout = QVBoxLayout()
         self.setLayout(self.layout)
@@ -246,7 +514,13 @@ class PowerMeterPlot(QWidget):
         self.wavelength.setMaximum(1100)
         self.wavelength.setValue(780)
         self.wavelength.setSuffix(" nm")
-        self.wavelength.valueChanged.connect(self.set_wavelength)
+        # coalesce rapid spinbox steps into a single instrument write so
+        # scrolling the box doesn't queue up blocking USB traffic
+        self._wl_timer = QTimer(singleShot=True)
+        self._wl_timer.timeout.connect(
+            lambda: self.set_wavelength(self.wavelength.value())
+        )
+        self.wavelength.valueChanged.connect(lambda _: self._wl_timer.start(150))
         self.set_wavelength(780)
 
         # sample rate
@@ -254,22 +528,28 @@ class PowerMeterPlot(QWidget):
         self.samplerate.addItem("0.1 Hz", 10000)
         self.samplerate.addItem("1 Hz", 1000)
         self.samplerate.addItem("10 Hz", 100)
-        if os.name == "nt":  # Windows PyQT6 will freeze up if we go too high?!
+        if IS_WIN:  # Windows PyQT6 will freeze up if we go too high?!
             self.samplerate.addItem("30 Hz", 20)
         else:
             self.samplerate.addItem("100 Hz", 10)
             self.samplerate.addItem("Max", 0)
         self.samplerate.setCurrentIndex(2)
-        self.samplerate.currentIndexChanged.connect(
-            lambda: self.timer.setInterval(self.samplerate.currentData())
-        )
+        self._interval = self.samplerate.currentData()
+
+        def set_interval():
+            # plain attribute so the acquisition thread can read it safely
+            self._interval = self.samplerate.currentData()
+
+        self.samplerate.currentIndexChanged.connect(set_interval)
 
         # averaging
         self.average = QSpinBox()
         self.average.setMinimum(1)
         self.average.setMaximum(100)
         self.average.setValue(10)
-        self.average.valueChanged.connect(self.set_average)
+        self._avg_timer = QTimer(singleShot=True)
+        self._avg_timer.timeout.connect(lambda: self.set_average(self.average.value()))
+        self.average.valueChanged.connect(lambda _: self._avg_timer.start(150))
 
         # start/stop button
         self.startstop = QPushButton("STOP")
@@ -277,10 +557,12 @@ class PowerMeterPlot(QWidget):
 
         def startstop():
             if not self.startstop.isChecked():
+                self.start_acquisition()
                 self.timer.start()
                 self.startstop.setStyleSheet("color: red; font-weight: bold")
                 self.startstop.setText("STOP")
             else:
+                self.stop_acquisition()
                 self.timer.stop()
                 self.startstop.setStyleSheet(
                     "background-color: red; color: white; font-weight: bold"
@@ -307,8 +589,15 @@ class PowerMeterPlot(QWidget):
         self.max_power.setStyleSheet("color: gray;")
 
         def reset():
-            self.timeData = []
-            self.powerData = []
+            self._head = 0
+            self._n = 0
+            self._max = -np.inf
+            self._ov_start = 0
+            self._ov_end = 0
+            self._ov_cnt = 0
+            self._ov_dirty = True
+            self._last_power_text = "W"
+            self._last_numvals_text = "# readings: 0"
             self.current_power.setText("W")
             self.numvals.setText("# readings: 0")
 
@@ -336,18 +625,28 @@ class PowerMeterPlot(QWidget):
         self.layout.addWidget(self.mainplot)
         self.timeplot, self.timecurve = self.create_timeplot(mainplot=self.mainplot)
         self.layout.addWidget(self.timeplot)
-        self.timeplot.setMaximumHeight(self.mainplot.height() // 5)
+        # 5:1 split via layout stretch; reading height() here would see the
+        # un-laid-out default and force an extra layout pass
+        self.layout.setStretch(self.layout.indexOf(self.mainplot), 5)
+        self.layout.setStretch(self.layout.indexOf(self.timeplot), 1)
 
-        # update plot every 100ms
+        # pay the numba compile (or cache load) here, not on the first frame
+        self._m4(np.zeros(8), np.zeros(8, dtype=np.float32), 0, 8, 1)
+
+        # redraw at ~30 Hz; the acquisition thread sets the sample rate
         self.timer = pg.QtCore.QTimer()
         self.timer.timeout.connect(self.update)
-        self.timer.start(self.samplerate.currentData())
+        self.timer.start(33)
+        self.start_acquisition()
 
         # diagnostic stats
         self.framecnt = FrameCounter()
 
         def updatefps(fps):
-            self.fps.setText(f"{fps:.1f} Hz")
+            txt = f"{fps:.1f} Hz"
+            if txt != self._last_fps_text:
+                self._last_fps_text = txt
+                self.fps.setText(txt)
 
         self.framecnt.sigFpsUpdate.connect(lambda fps: updatefps(fps))
         statsHBox = QHBoxLayout()
@@ -367,10 +666,12 @@ class PowerMeterPlot(QWidget):
                 options=options,
             )
             if fileName:
-                with open(fileName, "w") as f:
-                    f.write("Time (s), Power (W)\n")
-                    for t, p in zip(self.timeData, self.powerData):
-                        f.write(f"{t}, {p}\n")
+                # hand the write to a separate process so a long run never
+                # freezes the window while the file lands on disk
+                mp.Process(
+                    target=_save_csv,
+                    args=(fileName, np.array(self.times()), np.array(self.powers())),
+                ).start()
                 self.fileName = fileName
 
         self.save.clicked.connect(lambda: save(self))
@@ -409,7 +710,7 @@ def forkPlot(device):
 
 
 def initPowermeter(device):
-    if os.name == "nt":
+    if IS_WIN:
         devices = PM100D.listDevices()
         power_meter = devices.connect(device)
         power_meter.setPowerAutoRange(True)
@@ -474,9 +775,40 @@ class PowerMeterTracker(QMainWindow):
         container.setLayout(layout)
         self.setCentralWidget(container)
 
+        # react to kernel hotplug events instead of busy-polling the /dev
+        # tree; a slow timer stays on as a sanity net (and is the fallback
+        # on windows or when pyudev is missing)
+        self._monitor = None
+        if not IS_WIN:
+            try:
+                import pyudev
+
+                self._monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+                self._monitor.filter_by(subsystem="usbmisc")
+                self._monitor.start()
+                self._notifier = QSocketNotifier(
+                    self._monitor.fileno(), QSocketNotifier.Type.Read
+                )
+                self._notifier.activated.connect(self._on_hotplug)
+            except ImportError:
+                pass
+
+        # checking/unchecking a device should act immediately, not on the
+        # next timer tick; deferred so main_loop's own setCheckState calls
+        # don't re-enter it
+        self.listWidget.itemChanged.connect(
+            lambda _: QTimer.singleShot(0, self.main_loop)
+        )
+
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.main_loop)
-        self.timer.start(100)
+        self.timer.start(5000 if self._monitor is not None else 100)
+        self.main_loop()
+
+    def _on_hotplug(self):
+        # drain every queued udev event, then resync the list once
+        while self._monitor.poll(0) is not None:
+            pass
         self.main_loop()
 
     def shutdown_program(self):
@@ -496,7 +828,7 @@ class PowerMeterTracker(QMainWindow):
             self.listWidget.addItem(item)
 
         # keep the active powermeters up to date with the selection in qlistwidget
-        if os.name == "nt":
+        if IS_WIN:
             list = PM100D.listDevices()
             ports = list.resourceName
             serials = list.serialNumber
@@ -540,7 +872,7 @@ class PowerMeterTracker(QMainWindow):
 
         # remove any powermeters that are not plugged in
         for i in range(self.listWidget.count()).__reversed__():
-            if os.name == "nt":
+            if IS_WIN:
                 if not self.listWidget.item(i).text() in ports:
                     # if a process is running let it keep going
                     if (
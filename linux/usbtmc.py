@@ -3,6 +3,10 @@ import os
 
 class USBTMC(object):
     """Simple implementation of a USBTMC device driver, in the style of visa.h
+
+    All I/O goes through os.read/os.write, which release the GIL for the
+    duration of the blocking syscall - so a read in flight on the
+    acquisition thread never stalls the GUI thread's painting.
     """
 
     def __init__(self, device="/dev/usbtmc0"):
@@ -1,22 +1,78 @@
+import functools
 import os
 import pathlib
 import sys
 import glob
 
+
+@functools.lru_cache(maxsize=1)
+def _discoverLibPaths(root):
+    # the recursive walk is the slow part of importing this module, so
+    # the result is memoized in case the module is imported again
+    return tuple(glob.glob(f"{root}/*/**/", recursive=True))
+
+
 sys.path.insert(0, os.path.abspath("."))
+_existing = set(sys.path)
 sys.path.extend(
-    glob.glob(f"{pathlib.Path(__file__).parents[0].resolve()}/*/**/", recursive=True)
+    p
+    for p in _discoverLibPaths(str(pathlib.Path(__file__).parents[0].resolve()))
+    if p not in _existing
 )
+del _existing
 
 import pythonnet
 import clr
 
-clr.AddReference("System")
-from System import IntPtr, Text, UInt32
+import time
+
+# resolved lazily by _ensureClr; loading the System assembly at import
+# time costs seconds even when the meter is never touched
+IntPtr = None
+Text = None
+UInt32 = None
+_clrReady = False
 
-from copy import deepcopy
 
-import time
+def _ensureClr():
+    global IntPtr, Text, UInt32, _clrReady
+    if _clrReady:
+        return
+    clr.AddReference("System")
+    from System import IntPtr, Text, UInt32
+
+    _clrReady = True
+
+# sensor type -> (name, {subtype -> name}); two dict lookups instead of
+# a nested match cascade
+_SENSOR_TABLE = {
+    0x00: ("No sensor", {0x00: "No sensor"}),
+    0x01: (
+        "Photodiode sensor",
+        {
+            0x01: "Photodiode adapter",
+            0x02: "Photodiode sensor",
+            0x03: "Photodiode sensor with integrated filter identified by position",
+            0x12: "Photodiode sensor with temperature sensor",
+        },
+    ),
+    0x02: (
+        "Thermopile sensor",
+        {
+            0x01: "Thermopile adapter",
+            0x02: "Thermopile sensor",
+            0x12: "Thermopile sensor with temperature sensor",
+        },
+    ),
+    0x03: (
+        "Pyroelectric sensor",
+        {
+            0x01: "Pyroelectric adapter",
+            0x02: "Pyroelectric sensor",
+            0x12: "Pyroelectric sensor with temperature sensor",
+        },
+    ),
+}
 
 
 class PM100D:
@@ -24,17 +80,109 @@ class PM100D:
     defaultPath: str = os.path.join(os.path.dirname(__file__), "")
     defaultName: str = "Thorlabs.TLPM_64.Interop"
     driverVersion: str = ""
-    resourceCount: int = 0
-    resourceName: list[str] = []
-    modelName: list[str] = []
-    serialNumber: list[str] = []
-    manufacturer: list[str] = []
+
+    # per-instance; declared here for the type only. Class-level list
+    # defaults would be shared by every instance, so connecting one
+    # device would mutate the lists another instance reads.
+    resourceCount: int
+    resourceName: list[str]
+    modelName: list[str]
+    serialNumber: list[str]
+    manufacturer: list[str]
 
     TLPM = None
-    deviceNET = None
+
+    # device enumeration is slow (full TLPM scan through the interop layer)
+    # and rarely changes, so listDevices reuses the last scan for a while
+    cacheTTL: float = 5.0
+    _cacheTs: float = 0.0
+    _cachePath: str = None
+    _cachePayload: tuple = None
+
+    # diagnostic logging; call sites pass the precomputed prefix and raw
+    # values so nothing is formatted while logging is disabled
+    _logEnabled: bool = False
+    _logPrefix: str = "|PM100D|"
+
+    # models supporting the optional features, built once instead of a
+    # fresh set literal on every call
+    _ATTENUATION_MODELS = frozenset({"PM100D", "PM100A", "PM100USB", "PM200", "PM400"})
+    _VOLTAGE_MODELS = frozenset(
+        {"PM100D", "PM100A", "PM100USB", "PM160T", "PM200", "PM400"}
+    )
+    _DARK_MODELS = frozenset({"PM400"})
+
+    # one lookup table per flag nibble; 0x0000 (flag absent) simply
+    # misses the dict and contributes nothing
+    _FLAG_TABLES = (
+        {0x0001: "Power sensor; ", 0x0002: "Energy sensor; "},
+        {
+            0x0010: "Responsivity settable; ",
+            0x0020: "Wavelength settable; ",
+            0x0040: "Time constant settable; ",
+        },
+        {0x0100: "With Temperature sensor; "},
+    )
+
+    # fixed object shape: no per-instance __dict__, attribute access is
+    # an array index instead of a hash lookup
+    __slots__ = (
+        "deviceNET",
+        "resourceCount",
+        "resourceName",
+        "modelName",
+        "serialNumber",
+        "manufacturer",
+        "resourceNameConnected",
+        "sensorName",
+        "sensorSerialNumber",
+        "sensorCalibrationMessage",
+        "sensorType",
+        "sensorSubType",
+        "sensorFlags",
+        "averageTimeMax",
+        "averageTimeMin",
+        "averageTimeSet",
+        "timeoutValue",
+        "wavelengthMax",
+        "wavelengthMin",
+        "wavelengthSet",
+        "powerRangeMax",
+        "powerRangeMin",
+        "powerRangeSet",
+        "brightnessMax",
+        "brightnessMin",
+        "brightnessSet",
+        "attenuationMax",
+        "attenuationMin",
+        "attenuationSet",
+        "meterPowerReading",
+        "meterPowerUnit",
+        "meterVoltageReading",
+        "meterVoltageUnit",
+        "darkOffsetVoltage",
+        "darkOffsetUnit",
+        "isConnected",
+        "_rangeCache",
+        "_sbSensor",
+    )
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._logPrefix = f"|{cls.__name__}|"
 
     def __init__(self):
 
+        _ensureClr()
+
+        self.deviceNET = None
+
+        self.resourceCount = 0
+        self.resourceName = []
+        self.modelName = []
+        self.serialNumber = []
+        self.manufacturer = []
+
         self.resourceNameConnected = None
 
         self.sensorName = None
@@ -77,185 +225,196 @@ class PM100D:
 
         self.isConnected: bool = False
 
+        # hardware min/max limits are fixed per sensor, so each pair is
+        # queried across the interop boundary once and reused
+        self._rangeCache: dict[str, tuple[float, float]] = {}
+
+        # scratch StringBuilders for getSensorInfo, allocated lazily
+        self._sbSensor = None
+
     # print taking variable number of arguments
     @staticmethod
     def print(*args):
-        return
-        print(" ".join([str(arg) for arg in args]))
+        if PM100D._logEnabled:
+            print(" ".join(map(str, args)))
+
+    def _cloneForConnection(self, resourceName, deviceNET):
+        # build the connected instance directly; deepcopy dragged every
+        # attribute (including the .NET handle) through pickle machinery
+        new = PM100D()
+        new.deviceNET = deviceNET
+        new.resourceNameConnected = resourceName
+        new.isConnected = True
+
+        _index = self.resourceName.index(resourceName)
+        new.resourceName = self.resourceName[_index]
+        new.modelName = self.modelName[_index]
+        new.serialNumber = self.serialNumber[_index]
+        new.manufacturer = self.manufacturer[_index]
+        return new
 
     def connect(self, resourceName, ID_Query=True, Reset_Device=True):
         if not self.isConnected:
+            # cheaper than letting .index raise inside the try below
+            if resourceName not in self.resourceName:
+                self.print(self._logPrefix, "Unknown resource", resourceName)
+                return None
             try:
-                selfCopy = deepcopy(self)
-                selfCopy.TLPM = self.TLPM
-                selfCopy.deviceNET = selfCopy.TLPM(resourceName, ID_Query, Reset_Device)
+                deviceNET = self.TLPM(resourceName, ID_Query, Reset_Device)
                 self.print(
-                    f"|{self.__class__.__name__}| Successfully connect the device: {resourceName}"
+                    self._logPrefix, "Successfully connect the device:", resourceName
                 )
-
-                _index = self.resourceName.index(resourceName)
-
-                selfCopy.resourceNameConnected = resourceName
-
-                selfCopy.isConnected = True
-                selfCopy.resourceName = selfCopy.resourceName[_index]
-                selfCopy.modelName = selfCopy.modelName[_index]
-                selfCopy.serialNumber = selfCopy.serialNumber[_index]
-                selfCopy.manufacturer = selfCopy.manufacturer[_index]
-
-                self.isConnected = False
-                return selfCopy
-            except:
-                selfCopy.print(
-                    f"|{self.__class__.__name__}| Fail to connect the device."
+                return self._cloneForConnection(resourceName, deviceNET)
+            except Exception:
+                self.print(
+                    self._logPrefix, "Fail to connect the device."
                 )
 
     def connectForce(self, resourceName, ID_Query=True, Reset_Device=True):
+        if resourceName not in self.resourceName:
+            self.print(self._logPrefix, "Unknown resource", resourceName)
+            return None
         try:
-            selfCopy = deepcopy(self)
-            selfCopy.deviceNET = self.TLPM(resourceName, ID_Query, Reset_Device)
+            deviceNET = self.TLPM(resourceName, ID_Query, Reset_Device)
             self.print(
-                f"|{self.__class__.__name__}| Successfully connect the device: {resourceName}"
+                self._logPrefix, "Successfully connect the device:", resourceName
             )
-
-            _index = self.resourceName.index(resourceName)
-
-            selfCopy.resourceNameConnected = resourceName
-
-            selfCopy.isConnected = True
-            selfCopy.resourceName = selfCopy.resourceName[_index]
-            selfCopy.modelName = selfCopy.modelName[_index]
-            selfCopy.serialNumber = selfCopy.serialNumber[_index]
-            selfCopy.manufacturer = selfCopy.manufacturer[_index]
-
-            self.isConnected = False
-            return selfCopy
-        except:
-            selfCopy.print(
-                f"|{self.__class__.__name__}| Fail to connect the device."
+            return self._cloneForConnection(resourceName, deviceNET)
+        except Exception:
+            self.print(
+                self._logPrefix, "Fail to connect the device."
             )
 
     def disconnect(self):
         if self.isConnected:
             self.print(
-                f"|{self.__class__.__name__}| Disconnecting connected device {self.resourceNameConnected}"
+                self._logPrefix, "Disconnecting connected device", self.resourceNameConnected
             )
             try:
                 self.deviceNET.Dispose()
                 self.isConnected = False
                 self.print(
-                    f"|{self.__class__.__name__}| Device {self.resourceNameConnected} released properly"
+                    self._logPrefix, "Device", self.resourceNameConnected, "released properly"
                 )
             except:
                 self.print(
-                    f"|{self.__class__.__name__}| Unable to disconnect device."
+                    self._logPrefix, "Unable to disconnect device."
                 )
         else:
-            self.print(f"|{self.__class__.__name__}| Device not connected.")
+            self.print(self._logPrefix, "Device not connected.")
 
     def setAverageTime(self, averageTime):
-        _, self.averageTimeMin = self.deviceNET.getAvgTime(1)
-        _, self.averageTimeMax = self.deviceNET.getAvgTime(2)
-        _, self.averageTimeSet = self.deviceNET.getAvgTime(0)
+        if "avgTime" not in self._rangeCache:
+            self._rangeCache["avgTime"] = (
+                self.deviceNET.getAvgTime(1)[1],
+                self.deviceNET.getAvgTime(2)[1],
+            )
+        self.averageTimeMin, self.averageTimeMax = self._rangeCache["avgTime"]
         if self.averageTimeMin <= averageTime and averageTime <= self.averageTimeMax:
             averageTime = averageTime
         else:
             if self.averageTimeMin > averageTime:
                 self.print(
-                    f"|{self.__class__.__name__}| Exceed minimum average time! Force to the minimum."
+                    self._logPrefix, "Exceed minimum average time! Force to the minimum."
                 )
                 averageTime = self.averageTimeMin
             if averageTime > self.averageTimeMax:
                 self.print(
-                    f"|{self.__class__.__name__}| Exceed maximum average time! Force to the maximum."
+                    self._logPrefix, "Exceed maximum average time! Force to the maximum."
                 )
                 averageTime = self.averageTimeMax
 
         self.deviceNET.setAvgTime(averageTime)
         self.averageTimeSet = averageTime
         self.print(
-            f"|{self.__class__.__name__}| Average time set to {averageTime}"
+            self._logPrefix, "Average time set to", averageTime
         )
 
     def getAverageTime(self):
         self.averageTimeSet = self.deviceNET.getAvgTime(0)
         self.print(
-            f"|{self.__class__.__name__}| Average time set to {self.averageTimeSet}"
+            self._logPrefix, "Average time set to", self.averageTimeSet
         )
 
     def setTimeoutValue(self, timeout):
         self.deviceNET.setTimeoutValue(timeout)
         self.timeoutValue = timeout
         self.print(
-            f"|{self.__class__.__name__}| Timeout value set to {self.timeoutValue}"
+            self._logPrefix, "Timeout value set to", self.timeoutValue
         )
 
     def getTimeoutValue(self):
         _, self.timeoutValue = self.deviceNET.getTimeoutValue()
         self.print(
-            f"|{self.__class__.__name__}| Timeout value is {self.timeoutValue}"
+            self._logPrefix, "Timeout value is", self.timeoutValue
         )
 
     def setWaveLength(self, wavelength):
-        _, self.wavelengthMin = self.deviceNET.getWavelength(1)
-        _, self.wavelengthMax = self.deviceNET.getWavelength(2)
-        _, self.wavelengthSet = self.deviceNET.getWavelength(0)
+        if "wavelength" not in self._rangeCache:
+            self._rangeCache["wavelength"] = (
+                self.deviceNET.getWavelength(1)[1],
+                self.deviceNET.getWavelength(2)[1],
+            )
+        self.wavelengthMin, self.wavelengthMax = self._rangeCache["wavelength"]
 
         if self.wavelengthMin <= wavelength and wavelength <= self.wavelengthMax:
             wavelength = wavelength
         else:
             if self.wavelengthMin > wavelength:
                 self.print(
-                    f"|{self.__class__.__name__}| Exceed minimum wavelength! Force to the minimum."
+                    self._logPrefix, "Exceed minimum wavelength! Force to the minimum."
                 )
                 wavelength = self.wavelengthMin
             if wavelength > self.wavelengthMax:
                 self.print(
-                    f"|{self.__class__.__name__}| Exceed maximum wavelength! Force to the maximum."
+                    self._logPrefix, "Exceed maximum wavelength! Force to the maximum."
                 )
                 wavelength = self.wavelengthMax
 
         self.deviceNET.setWavelength(wavelength)
         self.wavelengthSet = wavelength
-        self.print(f"|{self.__class__.__name__}| Set wavelength to {wavelength}")
+        self.print(self._logPrefix, "Set wavelength to", wavelength)
 
     def getWaveLength(self):
         _, self.wavelengthSet = self.deviceNET.getWavelength(0)
         self.print(
-            f"|{self.__class__.__name__}| Wavelength was set to {self.wavelengthSet}"
+            self._logPrefix, "Wavelength was set to", self.wavelengthSet
         )
 
     def setPowerAutoRange(self, enable: bool):
         self.deviceNET.setPowerAutoRange(enable)
-        self.print(f"|{self.__class__.__name__}| Set auto power range")
+        self.print(self._logPrefix, "Set auto power range")
 
     def setPowerRange(self, maxRange):
-        _, self.powerRangeMin = self.deviceNET.getPowerRange(1)
-        _, self.powerRangeMax = self.deviceNET.getPowerRange(2)
-        _, self.powerRangeSet = self.deviceNET.getPowerRange(0)
+        if "powerRange" not in self._rangeCache:
+            self._rangeCache["powerRange"] = (
+                self.deviceNET.getPowerRange(1)[1],
+                self.deviceNET.getPowerRange(2)[1],
+            )
+        self.powerRangeMin, self.powerRangeMax = self._rangeCache["powerRange"]
         if self.powerRangeMin <= maxRange and maxRange <= self.powerRangeMax:
             maxRange = maxRange
         else:
             if self.powerRangeMin > maxRange:
                 self.print(
-                    f"|{self.__class__.__name__}| Exceed minimum range! Force to the minimum."
+                    self._logPrefix, "Exceed minimum range! Force to the minimum."
                 )
                 maxRange = self.powerRangeMin
 
             if maxRange > self.powerRangeMax:
                 self.print(
-                    f"|{self.__class__.__name__}| Exceed maximum range! Force to the maximum."
+                    self._logPrefix, "Exceed maximum range! Force to the maximum."
                 )
                 maxRange = self.powerRangeMax
 
         self.deviceNET.setPowerRange(maxRange)
         self.powerRangeSet = maxRange
-        self.print(f"|{self.__class__.__name__}| Set max range to {maxRange}")
+        self.print(self._logPrefix, "Set max range to", maxRange)
 
     def getPowerRange(self):
         self.powerRangeSet = self.deviceNET.getPowerRange(0)
         self.print(
-            f"|{self.__class__.__name__}| Max range was set to {self.powerRangeSet}"
+            self._logPrefix, "Max range was set to", self.powerRangeSet
         )
 
     def setDispBrightness(self, brightness):
@@ -268,32 +427,35 @@ class PM100D:
         else:
             if self.brightnessMin > brightness:
                 self.print(
-                    f"|{self.__class__.__name__}| Exceed minimum brightness! Force to the minimum."
+                    self._logPrefix, "Exceed minimum brightness! Force to the minimum."
                 )
                 brightness = self.brightnessMin
             if brightness > self.brightnessMax:
                 self.print(
-                    f"|{self.__class__.__name__}| Exceed maximum brightness! Force to the maximum."
+                    self._logPrefix, "Exceed maximum brightness! Force to the maximum."
                 )
                 brightness = self.brightnessMax
 
         self.deviceNET.setDispBrightness(brightness)
         self.brightnessSet = brightness
         self.print(
-            f"|{self.__class__.__name__}| Set Display brightness to {brightness}"
+            self._logPrefix, "Set Display brightness to", brightness
         )
 
     def getDispBrightness(self):
         self.brightnessSet = self.deviceNET.getDispBrightness()
         self.print(
-            f"|{self.__class__.__name__}| Display brightness was set to {self.brightnessSet}"
+            self._logPrefix, "Display brightness was set to", self.brightnessSet
         )
 
     def setAttenuation(self, attenuation):
-        if self.modelName in {"PM100D", "PM100A", "PM100USB", "PM200", "PM400"}:
-            _, self.attenuationMin = self.deviceNET.getAttenuation(1)
-            _, self.attenuationMax = self.deviceNET.getAttenuation(2)
-            _, self.attenuationSet = self.deviceNET.getAttenuation(0)
+        if self.modelName in self._ATTENUATION_MODELS:
+            if "attenuation" not in self._rangeCache:
+                self._rangeCache["attenuation"] = (
+                    self.deviceNET.getAttenuation(1)[1],
+                    self.deviceNET.getAttenuation(2)[1],
+                )
+            self.attenuationMin, self.attenuationMax = self._rangeCache["attenuation"]
 
             if (
                 self.attenuationMin <= attenuation
@@ -303,158 +465,82 @@ class PM100D:
             else:
                 if self.attenuationMin > attenuation:
                     self.print(
-                        f"|{self.__class__.__name__}| Exceed minimum brightness! Force to the minimum."
+                        self._logPrefix, "Exceed minimum brightness! Force to the minimum."
                     )
                     attenuation = self.attenuationMin
                 if attenuation > self.attenuationMax:
                     self.print(
-                        f"|{self.__class__.__name__}| Exceed maximum brightness! Force to the maximum."
+                        self._logPrefix, "Exceed maximum brightness! Force to the maximum."
                     )
                     attenuation = self.attenuationMax
 
             self.deviceNET.setAttenuation(attenuation)
             self.attenuationSet = attenuation
             self.print(
-                f"|{self.__class__.__name__}| Set Display brightness to {attenuation}"
+                self._logPrefix, "Set Display brightness to", attenuation
             )
         else:
             self.print(
-                f"|{self.__class__.__name__}| This power meter model does not support this function"
+                self._logPrefix, "This power meter model does not support this function"
             )
 
     def getAttenuation(self, attenuation):
-        if self.modelName in {"PM100D", "PM100A", "PM100USB", "PM200", "PM400"}:
+        if self.modelName in self._ATTENUATION_MODELS:
             self.attenuationSet = self.deviceNET.getAttenuation(0)
             self.print(
-                f"|{self.__class__.__name__}| Set Display brightness to {attenuation}"
+                self._logPrefix, "Set Display brightness to", attenuation
             )
         else:
             self.print(
-                f"|{self.__class__.__name__}| This power meter model does not support this function"
+                self._logPrefix, "This power meter model does not support this function"
             )
 
     def getSensorInfo(self):
-        _description = [
-            Text.StringBuilder(1024),
-            Text.StringBuilder(1024),
-            Text.StringBuilder(1024),
-        ]
+        # reuse the scratch buffers across calls; allocated on first use
+        if self._sbSensor is None:
+            self._sbSensor = [Text.StringBuilder(1024) for _ in range(3)]
+        _description = self._sbSensor
+        for _sb in _description:
+            _sb.Clear()
         _, _type, _subtype, _flag = self.deviceNET.getSensorInfo(
             _description[0], _description[1], _description[2]
         )
+        _serial = _description[1].ToString()
+        if _serial == self.sensorSerialNumber and self.sensorType is not None:
+            # same sensor as last call; the decoded info and the cached
+            # hardware limits are still valid
+            return
+
+        # a sensor swap changes the hardware limits
+        self._rangeCache.clear()
         self.sensorName = _description[0].ToString()
-        self.sensorSerialNumber = _description[1].ToString()
+        self.sensorSerialNumber = _serial
         self.sensorCalibrationMessage = _description[2].ToString()
 
-        match _type:
-            case 0x00:
-                self.sensorType = "No sensor"
-                match _subtype:
-                    case 0x00:
-                        self.sensorSubType = "No sensor"
-                    case _:
-                        self.print(
-                            f"|{self.__class__.__name__}| Unknown sensor."
-                        )
-            case 0x01:
-                self.sensorType = "Photodiode sensor"
-                match _subtype:
-                    case 0x01:
-                        self.sensorSubType = "Photodiode adapter"
-                    case 0x02:
-                        self.sensorSubType = "Photodiode sensor"
-                    case 0x03:
-                        self.sensorSubType = "Photodiode sensor with integrated filter identified by position"
-                    case 0x12:
-                        self.sensorSubType = "Photodiode sensor with temperature sensor"
-                    case _:
-                        self.print(
-                            f"|{self.__class__.__name__}| Unknown sensor."
-                        )
-
-            case 0x02:
-                self.sensorType = "Thermopile sensor"
-                match _subtype:
-                    case 0x01:
-                        self.sensorSubType = "Thermopile adapter"
-                    case 0x02:
-                        self.sensorSubType = "Thermopile sensor"
-                    case 0x12:
-                        self.sensorSubType = "Thermopile sensor with temperature sensor"
-                    case _:
-                        self.print(
-                            f"|{self.__class__.__name__}| Unknown sensor."
-                        )
-
-            case 0x03:
-                self.sensorType = "Pyroelectric sensor"
-                match _subtype:
-                    case 0x01:
-                        self.sensorSubType = "Pyroelectric adapter"
-                    case 0x02:
-                        self.sensorSubType = "Pyroelectric sensor"
-                    case 0x12:
-                        self.sensorSubType = (
-                            "Pyroelectric sensor with temperature sensor"
-                        )
-                    case _:
-                        self.print(
-                            f"|{self.__class__.__name__}| Unknown sensor."
-                        )
-            case _:
-                self.print(f"|{self.__class__.__name__}| Unknown sensor.")
-
-        _tag = _flag % 16
-        match _tag:
-            case 0x0000:
-                self.sensorFlags += ""
-            case 0x0001:
-                self.sensorFlags += "Power sensor; "
-            case 0x0002:
-                self.sensorFlags += "Energy sensor; "
-            case _:
-                self.sensorFlags += ""
-                self.print(f"|{self.__class__.__name__}| Unknown sensor.")
-
-        _flag -= _tag
-        _tag = _flag % (16 * 16)
-        match _tag:
-            case 0x0000:
-                self.sensorFlags += ""
-            case 0x0010:
-                self.sensorFlags += "Responsivity settable; "
-            case 0x0020:
-                self.sensorFlags += "Wavelength settable; "
-            case 0x0040:
-                self.sensorFlags += "Time constant settable; "
-            case _:
-                self.sensorFlags += ""
-                self.print(f"|{self.__class__.__name__}| Unknown sensor.")
-
-        _flag -= _tag
-        _tag = _flag % (16 * 16 * 16)
-        match _tag:
-            case 0x0000:
-                self.sensorFlags += ""
-            case 0x0100:
-                self.sensorFlags += "With Temperature sensor; "
-            case _:
-                self.print(f"|{self.__class__.__name__}| Unknown sensor.")
+        _name, _subs = _SENSOR_TABLE.get(_type, ("Unknown", {}))
+        self.sensorType = _name
+        self.sensorSubType = _subs.get(_subtype, "Unknown")
+        if self.sensorType == "Unknown" or self.sensorSubType == "Unknown":
+            self.print(self._logPrefix, "Unknown sensor.")
 
-        self.print(f"|{self.__class__.__name__}| Sensor info:")
-        self.print(f"|{self.__class__.__name__}| |--> Name: {self.sensorName}")
+        # isolate each flag nibble with a mask and decode via the tables
+        self.sensorFlags = "".join(
+            _tbl.get(_flag & _mask, "")
+            for _tbl, _mask in zip(self._FLAG_TABLES, (0x000F, 0x00F0, 0x0F00))
+        )
+
+        self.print(self._logPrefix, "Sensor info:")
+        self.print(self._logPrefix, "|--> Name:", self.sensorName)
         self.print(
-            f"|{self.__class__.__name__}| |--> S/N: {self.sensorSerialNumber}"
+            self._logPrefix, "|--> S/N:", self.sensorSerialNumber
         )
-        self.print(f"|{self.__class__.__name__}| |--> Type: {self.sensorType}")
+        self.print(self._logPrefix, "|--> Type:", self.sensorType)
         self.print(
-            f"|{self.__class__.__name__}| |--> SubType: {self.sensorSubType}"
+            self._logPrefix, "|--> SubType:", self.sensorSubType
         )
-        self.print(f"|{self.__class__.__name__}| |--> Flag: {self.sensorFlags}")
+        self.print(self._logPrefix, "|--> Flag:", self.sensorFlags)
 
-    def updatePowerReading(self, period: float = 0.5):
-        _, self.meterPowerReading = self.deviceNET.measPower()
-        time.sleep(period)
+    def _refreshPowerUnit(self):
         _, _unit = self.deviceNET.getPowerUnit()
         match _unit:
             case 0:
@@ -462,69 +548,116 @@ class PM100D:
             case 1:
                 self.meterPowerUnit = "dBm"
             case _:
-                self.print(f"|{self.__class__.__name__}| Unknown unit")
-
-    def updateVoltageReading(self, period: float = 0.5):
-        if self.modelName in {
-            "PM100D",
-            "PM100A",
-            "PM100USB",
-            "PM160T",
-            "PM200",
-            "PM400",
-        }:
+                self.print(self._logPrefix, "Unknown unit")
+
+    def updatePowerReading(self):
+        _, self.meterPowerReading = self.deviceNET.measPower()
+        # the unit is a configuration knob, not per-sample data; query it
+        # once and reuse instead of doubling the interop calls per poll
+        if self.meterPowerUnit is None:
+            self._refreshPowerUnit()
+
+    def pollPower(self, n: int, period: float) -> list[float]:
+        # batched fast path for tight polling loops: resolve the unit
+        # once, bind measPower to a local and only cross the interop
+        # boundary once per sample
+        if self.meterPowerUnit is None:
+            self._refreshPowerUnit()
+        out = [0.0] * n
+        meas = self.deviceNET.measPower
+        for i in range(n):
+            out[i] = meas()[1]
+            time.sleep(period)
+        return out
+
+    def updateVoltageReading(self):
+        if self.modelName in self._VOLTAGE_MODELS:
             try:
                 _, self.meterVoltageReading = self.deviceNET.measVoltage()
-                time.sleep(period)
                 self.meterVoltageUnit = "V"
             except:
                 self.print(
-                    f"|{self.__class__.__name__}| Wrong sensor type for this operation"
+                    self._logPrefix, "Wrong sensor type for this operation"
                 )
         else:
             self.print(
-                f"|{self.__class__.__name__}| This power meter model does not support this function"
+                self._logPrefix, "This power meter model does not support this function"
             )
 
     def darkAdjust(self):
-        if self.modelName in {"PM400"}:
+        if self.modelName in self._DARK_MODELS:
             self.deviceNET.startDarkAdjust()
-            _, _state = self.deviceNET.getDarkAdjustState()
-            while _state:
+            # poll with exponential backoff instead of spinning flat out
+            # against the interop boundary; calibration takes seconds
+            _delay = 0.005
+            while True:
                 _, _state = self.deviceNET.getDarkAdjustState()
+                if not _state:
+                    break
+                time.sleep(_delay)
+                _delay = min(_delay * 2, 0.05)
         else:
             self.print(
-                f"|{self.__class__.__name__}| This power meter model does not support this function"
+                self._logPrefix, "This power meter model does not support this function"
             )
 
     def getDarkOffset(self):
-        if self.modelName in {"PM400"}:
+        if self.modelName in self._DARK_MODELS:
             _, self.darkOffsetVoltage = self.deviceNET.getDarkOffset()
             self.darkOffsetUnit = "V"
         else:
             self.print(
-                f"|{self.__class__.__name__}| This power meter model does not support this function"
+                self._logPrefix, "This power meter model does not support this function"
             )
 
+    @classmethod
+    def invalidateDevices(cls):
+        """Force the next listDevices call to rescan the hardware."""
+        cls._cacheTs = 0.0
+
     @classmethod
     def listDevices(cls, libraryPath: str = defaultPath):
+        if (
+            cls._cachePayload is not None
+            and cls._cachePath == libraryPath
+            and time.monotonic() - cls._cacheTs < cls.cacheTTL
+        ):
+            inst = cls()
+            (
+                inst.resourceName,
+                inst.modelName,
+                inst.serialNumber,
+                inst.manufacturer,
+                inst.resourceCount,
+            ) = (
+                cls._cachePayload[0][:],
+                cls._cachePayload[1][:],
+                cls._cachePayload[2][:],
+                cls._cachePayload[3][:],
+                cls._cachePayload[4],
+            )
+            return inst
+
         if libraryPath.upper() not in [path.upper() for path in sys.path]:
             sys.path.extend(libraryPath)
 
-        try:
-            clr.AddReference(cls.defaultName)
-            from Thorlabs.TLPM_64.Interop import TLPM
+        _ensureClr()
 
-            cls.TLPM = TLPM
-            cls.print(
-                f"|{cls.__name__}| ThorlabsPowerMeter Driver Successfully Loaded."
-            )
+        if cls.TLPM is None:
+            try:
+                clr.AddReference(cls.defaultName)
+                from Thorlabs.TLPM_64.Interop import TLPM
 
-        except Exception as e:
-            cls.print(
-                f"|{cls.__name__}| Unable to load ThorlabsPowerMeter Driver."
-            )
-            cls.print(f"|{cls.__name__}| {e}")
+                cls.TLPM = TLPM
+                cls.print(
+                    cls._logPrefix, "ThorlabsPowerMeter Driver Successfully Loaded."
+                )
+
+            except Exception as e:
+                cls.print(
+                    cls._logPrefix, "Unable to load ThorlabsPowerMeter Driver."
+                )
+                cls.print(cls._logPrefix, e)
 
         _description = [
             Text.StringBuilder(2048),
@@ -534,35 +667,50 @@ class PM100D:
         ]
 
         _tempInstance = cls.TLPM(IntPtr(0))
-        _, cls.resourceCount = _tempInstance.findRsrc()
+        _, _count = _tempInstance.findRsrc()
 
-        cls.resourceName.clear()
-        cls.modelName.clear()
-        cls.serialNumber.clear()
-        cls.manufacturer.clear()
+        _names = []
+        _models = []
+        _serials = []
+        _makers = []
 
-        if cls.resourceCount <= 0:
-            cls.print(f"|{cls.__name__}| No device found.")
+        if _count <= 0:
+            cls.print(cls._logPrefix, "No device found.")
         else:
             cls.print(
-                f"|{cls.__name__}| {cls.resourceCount} device(s) are found."
+                cls._logPrefix, _count, "device(s) are found."
             )
-            for i in range(cls.resourceCount):
+            for i in range(_count):
                 _tempInstance.getRsrcName(UInt32(i), _description[0])
                 _, _ = _tempInstance.getRsrcInfo(
                     UInt32(i), _description[1], _description[2], _description[3]
                 )
 
-                cls.resourceName.append(deepcopy(_description[0].ToString()))
-                cls.modelName.append(deepcopy(_description[1].ToString()))
-                cls.serialNumber.append(deepcopy(_description[2].ToString()))
-                cls.manufacturer.append(deepcopy(_description[3].ToString()))
+                _names.append(_description[0].ToString())
+                _models.append(_description[1].ToString())
+                _serials.append(_description[2].ToString())
+                _makers.append(_description[3].ToString())
                 cls.print(
-                    f"|{cls.__name__}| Found resource {_description[0].ToString()}."
+                    cls._logPrefix, "Found resource", _names[-1], "."
                 )
         del _tempInstance, _description
-        cls.print(f"|{cls.__name__}| Device scan is completed.")
-        return cls()
+        cls._cacheTs = time.monotonic()
+        cls._cachePath = libraryPath
+        cls._cachePayload = (
+            _names[:],
+            _models[:],
+            _serials[:],
+            _makers[:],
+            _count,
+        )
+        cls.print(cls._logPrefix, "Device scan is completed.")
+        inst = cls()
+        inst.resourceName = _names
+        inst.modelName = _models
+        inst.serialNumber = _serials
+        inst.manufacturer = _makers
+        inst.resourceCount = _count
+        return inst
 
 
 if __name__ == "__main__":
@@ -579,9 +727,10 @@ if __name__ == "__main__":
     # deviceA.darkAdjust() # PM400 ONLY
     # deviceA.getDarkOffset() # PM400 ONLY
     for i in range(100):
-        deviceA.updatePowerReading(0.1)
+        deviceA.updatePowerReading()
         print(f"{deviceA.meterPowerReading} {deviceA.meterPowerUnit}")
-        # deviceA.updateVoltageReading(0.1)  # PM400 ONLY
+        time.sleep(0.1)
+        # deviceA.updateVoltageReading()  # PM400 ONLY
         # print(f'{deviceA.meterVoltageReading} {deviceA.meterVoltageUnit}')  # PM400 ONLY
 
     deviceA.disconnect()